@@ -4,10 +4,10 @@ using a Twitter development account and the tweepy package.
 Twitter access keys are saved as environmental variables capstoneAPI,
 capstoneAPISecret, capstoneAccess, and capstoneAccessSecret.
 
-Tweets are downloaded in batches (batch_size) every 15 minutes to
-comply with Twitter rate limits. The total number of tweets downloaded
-is determined by the tweet_limit. The search_term is the word or
-phrase used to search Twitter.
+Tweets are downloaded in batches (batch_size) as fast as the Twitter
+rate limit allows, pausing only until the rate limit window resets.
+The total number of tweets downloaded is determined by the tweet_limit.
+The search_term is the word or phrase used to search Twitter.
 
 Downloaded tweets are saved in a json file (output_tweets) for later
 analysis.
@@ -21,7 +21,7 @@ Required packages: tweepy
 import os
 import tweepy
 import json
-import time
+from tweet_tools import RateLimitScheduler, search_batches
 
 search_term = 'climate change'
 output_tweets = 'climate-change_tweets.json'
@@ -35,13 +35,13 @@ auth.set_access_token(os.environ['capstoneAccess'], os.environ['capstoneAccessSe
 # create the connection
 api = tweepy.API(auth)
 
-# get tweets in batches of 500 every 15 minutes
+# get tweets in batches of 500 as the rate limit allows
+scheduler = RateLimitScheduler()
 tweet_list = []
-while len(tweet_list) < tweet_limit:
-    for tweet in tweepy.Cursor(api.search, q=search_term, lang="en", since=2021-1-1).items(batch_size):
-        tweet_list.append(tweet._json)
-    if len(tweet_list) < tweet_limit:
-        time.sleep(60 * 15)
+for batch in search_batches(api, scheduler, batch_size, q=search_term, lang="en", since=2021-1-1):
+    tweet_list.extend(batch)
+    if len(tweet_list) >= tweet_limit:
+        break
 
 # write tweet data to a JSON file
 with open(output_tweets, 'w') as f:
@@ -0,0 +1,22 @@
+"""
+This command line script migrates the tweets table of a database (db_name)
+created by an earlier version of these scripts to the current schema.
+
+Version 2 stores created_at as a DATETIME (created) and its hour (hour),
+and indexes user_id and created. The columns are added and filled in
+batches of batch_size tweets, so the database can keep collecting and
+analyzing tweets during the migration. Running the script again continues
+an interrupted migration.
+
+Tweets are stored in a MySQL database (db_name) using the package
+SQLalchemy. MySQL user is set to root and MySQL password is saved in the
+environmental variable mySQLpwd.
+
+Required package: sqlalchemy, MySQL
+"""
+from tweet_tools import migrate_tweets_db
+
+db_name = 'climate_change_tweets'
+batch_size = 10000
+
+migrate_tweets_db(db_name, batch_size)
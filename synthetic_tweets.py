@@ -0,0 +1,30 @@
+"""
+This command line script creates a synthetic corpus of tweets for testing
+the fetch and analyze scripts on collections far larger than can be
+downloaded from Twitter.
+
+Generated tweets have the fields used by the other scripts (id,
+created_at, full_text, text, and the user's screen_name, name,
+followers_count and friends_count). Words and tweeting users follow Zipf
+distributions, so a few of each are very common and most are rare. The
+same seed always produces the same corpus.
+
+Tweets are saved to a json file (output_tweets), one per line if the
+filename ends with .jsonl, or to a MySQL database (db_name) when one is
+given. MySQL user is set to root and MySQL password is saved in the
+environmental variable mySQLpwd.
+
+Required packages: numpy (and sqlalchemy, MySQL for databases)
+"""
+
+from tweet_tools import write_synthetic_tweets, store_synthetic_tweets
+
+tweet_count = 1000000
+seed = 2021
+output_tweets = 'synthetic_tweets.jsonl'
+db_name = None
+
+if db_name:
+    store_synthetic_tweets(db_name, tweet_count, seed=seed)
+else:
+    write_synthetic_tweets(output_tweets, tweet_count, seed=seed)